@@ -11,6 +11,7 @@ data on NEOs and close approaches extracted by `extract.load_neos` and
 
 You'll edit this file in Tasks 2 and 3.
 """
+from collections import defaultdict
 from filters import AttributeFilter
 from models import NearEarthObject, CloseApproach
 from typing import Collection, Iterable, Optional
@@ -47,26 +48,33 @@ class NEODatabase:
         :param neos: A collection of `NearEarthObject`s.
         :param approaches: A collection of `CloseApproach`es.
         """
-        self._neos = neos
-        self._approaches = approaches
-
-        # Useful auxiliary data structures
-        self._name2neo = {}
-        self._des2neo = {}
+        # Store the collections as tuples - a compact, contiguous block of
+        # references that iterates faster than a set and can't be resized.
+        self._neos = tuple(neos)
+        self._approaches = tuple(approaches)
+
+        # Useful auxiliary data structures, each built in a single pass.
+        # In the relatively rare case, there are multiple NEOs with the same
+        # name. It's acceptable that `get_neo_by_name()` return any of them.
+        self._des2neo = {neo.designation: neo for neo in self._neos}
+        self._name2neo = {neo.name: neo for neo in self._neos if neo.name}
+
+        # Link together the NEOs and their close approaches. Group the
+        # approaches by designation in one pass, then hand each NEO its
+        # group by reference instead of appending approach-by-approach.
+        approaches_by_designation = defaultdict(list)
+        for approach in self._approaches:
+            approaches_by_designation[approach._designation].append(approach)
 
-        # Link together the NEOs and their close approaches.
         for neo in self._neos:
-            self._des2neo[neo.designation] = neo
-            if neo.name:
-                self._name2neo[neo.name] = neo
-                # In the relatively rare case,
-                # there are multiple NEOs with the same name.
-                # It's acceptable that `get_neo_by_name()` return any of them.
-
-            for approach in self._approaches:
-                if approach._designation == neo.designation:
-                    approach.neo = neo
-                    neo.approaches.append(approach)
+            linked = approaches_by_designation.get(neo.designation)
+            if linked is None:
+                # No close approaches on record - keep the NEO's initial
+                # empty collection rather than allocating a fresh list.
+                continue
+            neo.approaches = linked
+            for approach in linked:
+                approach.neo = neo
 
     def get_neo_by_designation(self, designation: str) -> Optional[NearEarthObject]:
         """Find and return an NEO by its primary designation.
@@ -81,10 +89,7 @@ class NEODatabase:
         :param designation: The primary designation of the NEO to search for.
         :return: The `NearEarthObject` with the desired primary designation, or `None`.
         """
-        try:
-            return self._des2neo[designation]
-        except KeyError:
-            return None
+        return self._des2neo.get(designation)
 
     def get_neo_by_name(self, name: str) -> Optional[NearEarthObject]:
         """Find and return an NEO by its name.
@@ -100,10 +105,7 @@ class NEODatabase:
         :param name: The name, as a string, of the NEO to search for.
         :return: The `NearEarthObject` with the desired name, or `None`.
         """
-        try:
-            return self._name2neo[name]
-        except KeyError:
-            return None
+        return self._name2neo.get(name)
 
     def query(self, filters: Collection[AttributeFilter] = ()) -> Iterable[CloseApproach]:
         """Query close approaches to generate those that match a collection of filters.
@@ -119,11 +121,22 @@ class NEODatabase:
         :param filters: A collection of filters capturing user-specified criteria.
         :return: A stream of matching `CloseApproach` objects.
         """
+        filters = tuple(filters)
+        if not filters:
+            # Nothing to evaluate - stream every approach directly.
+            yield from self._approaches
+            return
+        # Unpack each filter into its accessor, comparator and reference
+        # value once, so the row loop calls them directly instead of going
+        # through AttributeFilter.__call__ per filter per approach.
+        predicates = tuple((f.get, f.op, f.value) for f in filters)
         for approach in self._approaches:
-            try:
-                if all({filter(approach) for filter in filters}):
-                    yield approach
-            # get() of DiameterFilter and HazardousFilter could return None
-            # if the close-approach does not associate to a neo.
-            except TypeError:
-                return
+            for get, op, value in predicates:
+                attribute = get(approach)
+                # get() of DiameterFilter and HazardousFilter could return
+                # None if the close approach does not associate to an NEO -
+                # skip the approach rather than abort the stream.
+                if attribute is None or not op(attribute, value):
+                    break
+            else:
+                yield approach
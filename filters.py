@@ -63,8 +63,16 @@ class AttributeFilter:
         self.value = value
 
     def __call__(self, approach):
-        """Invoke `self(approach)`."""
-        return self.op(self.get(approach), self.value)
+        """Invoke `self(approach)`.
+
+        Return `None` (rather than raising a `TypeError` from the comparator)
+        if the attribute of interest is unavailable - for example, when the
+        approach isn't associated to an NEO.
+        """
+        attribute = self.get(approach)
+        if attribute is None:
+            return None
+        return self.op(attribute, self.value)
 
     @classmethod
     def get(cls, approach: CloseApproach):
@@ -189,28 +197,28 @@ def create_filters(
     :param hazardous: Whether the NEO of a matching `CloseApproach` is potentially hazardous.
     :return: A collection of filters for use with `query`.
     """
-    filters = set()
+    filters = []
     if date:
-        filters.add(DateFilter(operator.eq, date))
+        filters.append(DateFilter(operator.eq, date))
     if start_date:
-        filters.add(DateFilter(operator.ge, start_date))
+        filters.append(DateFilter(operator.ge, start_date))
     if end_date:
-        filters.add(DateFilter(operator.le, end_date))
+        filters.append(DateFilter(operator.le, end_date))
     if distance_min:
-        filters.add(DistanceFilter(operator.ge, distance_min))
+        filters.append(DistanceFilter(operator.ge, distance_min))
     if distance_max:
-        filters.add(DistanceFilter(operator.le, distance_max))
+        filters.append(DistanceFilter(operator.le, distance_max))
     if velocity_min:
-        filters.add(VelocityFilter(operator.ge, velocity_min))
+        filters.append(VelocityFilter(operator.ge, velocity_min))
     if velocity_max:
-        filters.add(VelocityFilter(operator.le, velocity_max))
+        filters.append(VelocityFilter(operator.le, velocity_max))
     if diameter_min:
-        filters.add(DiameterFilter(operator.ge, diameter_min))
+        filters.append(DiameterFilter(operator.ge, diameter_min))
     if diameter_max:
-        filters.add(DiameterFilter(operator.le, diameter_max))
+        filters.append(DiameterFilter(operator.le, diameter_max))
     if hazardous != None:
-        filters.add(HazardousFilter(operator.eq, hazardous))
-    return filters
+        filters.append(HazardousFilter(operator.eq, hazardous))
+    return tuple(filters)
 
 
 def limit(iterator: Iterable[CloseApproach], n: Optional[int] = None) -> Iterable[CloseApproach]:
@@ -21,6 +21,7 @@ from __future__ import annotations
 from helpers import cd_to_datetime, datetime_to_str
 from typing import Optional, List, Union
 import datetime
+import sys
 
 
 class NearEarthObject:
@@ -36,6 +37,8 @@ class NearEarthObject:
     `NEODatabase` constructor.
     """
 
+    __slots__ = ('designation', 'name', 'diameter', 'hazardous', 'approaches')
+
     def __init__(
         self,
         designation: str = '',
@@ -65,10 +68,10 @@ class NearEarthObject:
         :param neo_row: A List of data about one near-earth object
         """
         return cls(
-            designation=str(neo_row[3]),
+            designation=sys.intern(str(neo_row[3])),
             name=str(neo_row[4]) if neo_row[4] else None,
             diameter=float(neo_row[15]) if neo_row[15] else float('nan'),
-            hazardous=True if str(neo_row[7]) == "Y" else False
+            hazardous=str(neo_row[7]) == "Y"
         )
 
     @property
@@ -103,6 +106,8 @@ class CloseApproach:
     `NEODatabase` constructor.
     """
 
+    __slots__ = ('_designation', '_time_cd', '_time', 'distance', 'velocity', 'neo', '_time_str')
+
     def __init__(
         self,
         designation: str = '',
@@ -118,13 +123,19 @@ class CloseApproach:
         :param velocity: A float of the velocity, in kilometers per second, of the NEO relative to Earth at the closest point.
         """
         self._designation: str = designation
-        self.time: datetime.datetime = cd_to_datetime(time)
+        # Keep the NASA-formatted string and defer the (expensive) strptime
+        # call until the approach time is actually needed.
+        self._time_cd: str = time
+        self._time: Optional[datetime.datetime] = None
         self.distance: float = distance
         self.velocity: float = velocity
 
         # Create an attribute for the referenced NEO, originally None.
         self.neo: Optional[NearEarthObject] = None
 
+        # Cache for the formatted approach time, filled on first use.
+        self._time_str: Optional[str] = None
+
     @classmethod
     def create(cls, data) -> CloseApproach:
         """Create a new `CloseApproach`.
@@ -132,12 +143,27 @@ class CloseApproach:
         :param data: A List of data about one close approach
         """
         return cls(
-            designation=str(data[0]),
+            designation=sys.intern(str(data[0])),
             time=str(data[3]),
             distance=float(data[4]) if data[4] else 0.0,
             velocity=float(data[7]) if data[7] else 0.0,
         )
 
+    @property
+    def time(self) -> datetime.datetime:
+        """Return the date and time, in UTC, at which the NEO passes closest to Earth.
+
+        The NASA-formatted calendar date supplied to the constructor is parsed
+        on first access and cached, so approaches that are never inspected by a
+        date-based filter or serialized don't pay for `strptime`. Once parsed,
+        the raw string is released - each approach holds one representation of
+        its time, never both.
+        """
+        if self._time is None:
+            self._time = cd_to_datetime(self._time_cd)
+            self._time_cd = ''
+        return self._time
+
     def as_dict(self) -> dict[str, Union[str, float, dict[str, Union[str, float, None]]]]:
         """Create a new `CloseApproach`.
 
@@ -166,9 +192,12 @@ class CloseApproach:
 
         The `datetime_to_str` method converts a `datetime` object to a
         formatted string that can be used in human-readable representations and
-        in serialization to CSV and JSON files.
+        in serialization to CSV and JSON files. The formatted string is
+        computed once and cached, since the approach time never changes.
         """
-        return datetime_to_str(self.time)
+        if self._time_str is None:
+            self._time_str = datetime_to_str(self.time)
+        return self._time_str
 
     def __str__(self):
         """Return `str(self)`."""
@@ -15,6 +15,12 @@ import json
 from models import CloseApproach
 from typing import Iterable
 
+try:
+    import orjson
+except ImportError:
+    # `orjson` is an optional accelerator - fall back to the stdlib encoder.
+    orjson = None
+
 
 def write_to_csv(results: Iterable[CloseApproach], filename: str) -> None:
     """Write an iterable of `CloseApproach` objects to a CSV file.
@@ -30,20 +36,24 @@ def write_to_csv(results: Iterable[CloseApproach], filename: str) -> None:
         'datetime_utc', 'distance_au', 'velocity_km_s',
         'designation', 'name', 'diameter_km', 'potentially_hazardous'
     )
+    # Convert every cell to its output string up front, so the writer only
+    # has to scan for characters that need quoting.
+    rows = (
+        (
+            approach.time_str,
+            str(approach.distance),
+            str(approach.velocity),
+            approach._designation,
+            (approach.neo.name or '') if approach.neo else '',
+            str(approach.neo.diameter) if approach.neo else '',
+            str(approach.neo.hazardous) if approach.neo else '',
+        )
+        for approach in results
+    )
     with open(filename, 'w') as f:
-        writer = csv.writer(f)
+        writer = csv.writer(f, quoting=csv.QUOTE_MINIMAL)
         writer.writerow(fieldnames)
-        for approach in results:
-            row = (
-                approach.time_str,
-                approach.distance,
-                approach.velocity,
-                approach._designation,
-                approach.neo.name if approach.neo else None,
-                approach.neo.diameter if approach.neo else None,
-                approach.neo.hazardous if approach.neo else None,
-            )
-            writer.writerow(row)
+        writer.writerows(rows)
 
 
 def write_to_json(results: Iterable[CloseApproach], filename: str) -> None:
@@ -57,6 +67,21 @@ def write_to_json(results: Iterable[CloseApproach], filename: str) -> None:
     :param results: An iterable of `CloseApproach` objects.
     :param filename: A Path-like object pointing to where the data should be saved.
     """
-    results_as_dicts = [result.as_dict() for result in results]
     with open(filename, "w") as f:
-        json.dump(results_as_dicts, f, indent=2)
+        # Stream one approach at a time so the whole result set never has
+        # to be materialized as a list of dictionaries in memory.
+        f.write("[")
+        separator = "\n"
+        for result in results:
+            f.write(separator)
+            record = result.as_dict()
+            diameter = record["neo"]["diameter_km"]
+            if orjson is not None and diameter == diameter:
+                f.write(orjson.dumps(record, option=orjson.OPT_INDENT_2).decode())
+            else:
+                # orjson has no representation for a NaN diameter, so keep
+                # the stdlib encoder (which emits the NaN literal) for
+                # records of NEOs with an unknown diameter.
+                json.dump(record, f, indent=2)
+            separator = ",\n"
+        f.write("\n]\n")